@@ -7,10 +7,29 @@ def read_requirements():
     with open(requirements_path) as req:
         return req.read().splitlines()
 
+def optional_extensions():
+    # the compiled pose kernels are a build-time nicety, not a requirement -
+    # without Cython (or a working compiler) the package installs pure Python
+    # and stream_pose_ml.blaze_pose.pose_kernels falls back to NumPy
+    try:
+        from Cython.Build import cythonize
+        from setuptools import Extension
+        import numpy
+    except ImportError:
+        return []
+    extension = Extension(
+        'stream_pose_ml.blaze_pose._pose_kernels',
+        ['stream_pose_ml/stream_pose_ml/blaze_pose/_pose_kernels.pyx'],
+        include_dirs=[numpy.get_include()],
+        extra_compile_args=['-O3'],
+    )
+    return cythonize([extension], compiler_directives={'language_level': 3})
+
 setup(
     install_requires=read_requirements(),
     package_dir={'': 'stream_pose_ml'},
     packages=find_packages(where='stream_pose_ml'),
+    ext_modules=optional_extensions(),
     use_scm_version={"write_to": "version.txt", "fallback_version": "0.1.0", "root": ".", "relative_to": __file__},
 )
 
@@ -0,0 +1,76 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""Compiled C implementations of the whole-sequence pose kernels.
+
+Built as an optional extension for deployments that can't take Numba as a
+runtime dependency - pose_kernels falls back to these when Numba is absent,
+and to pure NumPy when this module didn't build. Signatures and results
+match the pose_kernels implementations exactly.
+"""
+from libc.math cimport sqrt, acos
+
+import numpy as np
+
+cimport numpy as cnp
+
+cnp.import_array()
+
+
+def compute_plumblines(cnp.float32_t[:, :, ::1] tensor,
+                       int left_shoulder, int right_shoulder,
+                       int left_hip, int right_hip):
+    cdef Py_ssize_t num_frames = tensor.shape[0]
+    cdef Py_ssize_t num_columns = tensor.shape[2]
+    out_array = np.empty((num_frames, num_columns), dtype=np.float32)
+    cdef cnp.float32_t[:, ::1] out = out_array
+    cdef Py_ssize_t f, c
+    cdef float neck, mid_hip
+    with nogil:
+        for f in range(num_frames):
+            for c in range(num_columns):
+                neck = 0.5 * (tensor[f, left_shoulder, c] + tensor[f, right_shoulder, c])
+                mid_hip = 0.5 * (tensor[f, left_hip, c] + tensor[f, right_hip, c])
+                out[f, c] = mid_hip - neck
+    return out_array
+
+
+def compute_vector_angles(cnp.float32_t[:, :, ::1] tensor,
+                          cnp.int64_t[:, ::1] pair_index):
+    cdef Py_ssize_t num_frames = tensor.shape[0]
+    cdef Py_ssize_t num_angles = pair_index.shape[0]
+    out_array = np.empty((num_frames, num_angles, 2), dtype=np.float32)
+    cdef cnp.float32_t[:, :, ::1] out = out_array
+    cdef Py_ssize_t f, k
+    cdef cnp.int64_t a1, a2, b1, b2
+    cdef double v1x, v1y, v1z, v2x, v2y, v2z, n1, n2, cos
+    with nogil:
+        for f in range(num_frames):
+            for k in range(num_angles):
+                a1 = pair_index[k, 0]
+                a2 = pair_index[k, 1]
+                b1 = pair_index[k, 2]
+                b2 = pair_index[k, 3]
+                v1x = tensor[f, a2, 0] - tensor[f, a1, 0]
+                v1y = tensor[f, a2, 1] - tensor[f, a1, 1]
+                v1z = tensor[f, a2, 2] - tensor[f, a1, 2]
+                v2x = tensor[f, b2, 0] - tensor[f, b1, 0]
+                v2y = tensor[f, b2, 1] - tensor[f, b1, 1]
+                v2z = tensor[f, b2, 2] - tensor[f, b1, 2]
+                # 2D angle from the x/y components only
+                n1 = sqrt(v1x * v1x + v1y * v1y) + 1e-12
+                n2 = sqrt(v2x * v2x + v2y * v2y) + 1e-12
+                cos = (v1x * v2x + v1y * v2y) / (n1 * n2)
+                if cos > 1.0:
+                    cos = 1.0
+                elif cos < -1.0:
+                    cos = -1.0
+                out[f, k, 0] = acos(cos)
+                # 3D angle
+                n1 = sqrt(v1x * v1x + v1y * v1y + v1z * v1z) + 1e-12
+                n2 = sqrt(v2x * v2x + v2y * v2y + v2z * v2z) + 1e-12
+                cos = (v1x * v2x + v1y * v2y + v1z * v2z) / (n1 * n2)
+                if cos > 1.0:
+                    cos = 1.0
+                elif cos < -1.0:
+                    cos = -1.0
+                out[f, k, 1] = acos(cos)
+    return out_array
@@ -1,11 +1,13 @@
+import numpy as np
+
 from stream_pose_ml.geometry.joint import Joint
 from stream_pose_ml.geometry.vector import Vector
-from stream_pose_ml.geometry.angle import Angle
+from stream_pose_ml.geometry.angle import Angle, batch_angles
 from stream_pose_ml.geometry.distance import Distance
 from stream_pose_ml.blaze_pose.openpose_mediapipe_transformer import (
     OpenPoseMediapipeTransformer,
 )
-from stream_pose_ml.blaze_pose.enumerations import BlazePoseJoints
+from stream_pose_ml.blaze_pose.enumerations import JOINT_INDEX, blaze_pose_joints
 
 
 class BlazePoseFrame:
@@ -14,6 +16,32 @@ class BlazePoseFrame:
     It stores meta-data related to the frame and also computes angle measurements if joint positions are present
     """
 
+    # fixed attribute storage - one frame per video frame, so skipping the
+    # per-instance __dict__ meaningfully cuts memory on long sequences
+    __slots__ = (
+        "frame_number",
+        "has_joint_positions",
+        "image_dimensions",
+        "sequence_id",
+        "sequence_source",
+        "joints",
+        "joint_array",
+        "joint_positions_raw",
+        "angles",
+        "vectors",
+        "distances",
+        "has_openpose_joints_and_vectors",
+    )
+
+    # ordered joint names shared by every frame instance
+    joint_position_names = blaze_pose_joints
+    # map of joint name to row index in the joint_array SoA representation
+    JOINT_INDEX = JOINT_INDEX
+    # column layout of each joint_array row
+    JOINT_ARRAY_COLUMNS = ("x", "y", "z", "x_normalized", "y_normalized", "z_normalized")
+    # keys every joint position dict must provide
+    REQUIRED_JOINT_KEYS = frozenset(JOINT_ARRAY_COLUMNS)
+
     joint_positions: list
     frame_number: int
     has_joint_positions: bool
@@ -21,6 +49,7 @@ class BlazePoseFrame:
     sequence_id: int
     sequence_source: str
     joints: dict
+    joint_array: np.ndarray  # (num_joints, 6) array of joint coordinates
     angles: dict
     vectors: dict
     distances: dict
@@ -60,8 +89,8 @@ class BlazePoseFrame:
                 specialized joints and vectors for translating between BlazePose model and OpenPose
 
         """
-        self.joint_position_names = [joint.name for joint in BlazePoseJoints]
         self.joints = {}
+        self.joint_array = None
         self.vectors = {}
         self.angles = {}
         self.distances = {}
@@ -115,9 +144,19 @@ class BlazePoseFrame:
         try:
             if not self.has_joint_positions:
                 raise BlazePoseFrameError("There are no joint positions to set")
+            joints_raw = self.joint_positions_raw
+            # store all coordinates in a single (num_joints, 6) array (structure
+            # of arrays) so vector math can slice contiguous rows by index
+            # instead of dereferencing per-joint objects
+            self.joint_array = np.array(
+                [
+                    [joints_raw[joint][key] for key in self.JOINT_ARRAY_COLUMNS]
+                    for joint in self.joint_position_names
+                ],
+                dtype=np.float32,
+            )
             joint_positions = {}
             for joint in self.joint_position_names:
-                joints_raw = self.joint_positions_raw
                 joint_data = {
                     "image_dimensions": self.image_dimensions,
                     "x": joints_raw[joint]["x"],
@@ -153,26 +192,15 @@ class BlazePoseFrame:
 
 
         """
-        required_joint_keys = [
-            "x",
-            "y",
-            "z",
-            "x_normalized",
-            "y_normalized",
-            "z_normalized",
-        ]
-
         for joint in self.joint_position_names:
-            if joint in joint_positions:
-                for key in required_joint_keys:
-                    if key in joint_positions[joint]:
-                        continue
-                    else:
-                        raise BlazePoseFrameError(
-                            f"{key} missing from {joint} position data"
-                        )
-            else:
+            joint_data = joint_positions.get(joint)
+            if joint_data is None:
                 raise BlazePoseFrameError(f"{joint} missing from joint positions dict")
+            missing = self.REQUIRED_JOINT_KEYS - joint_data.keys()
+            if missing:
+                raise BlazePoseFrameError(
+                    f"{', '.join(sorted(missing))} missing from {joint} position data"
+                )
 
         return True
 
@@ -227,11 +255,29 @@ class BlazePoseFrame:
                 OpenPoseMediapipeTransformer.create_openpose_joints_and_vectors(self)
             )
 
-        angles = {}
+        # compute every angle in the map with one batched call so shared
+        # vector endpoints aren't renormalized once per measure
+        measures = list(angle_map.items())
+        directions_1 = np.array(
+            [self.vectors[vector_1].direction_3d for _, (vector_1, _) in measures],
+            dtype=np.float32,
+        )
+        directions_2 = np.array(
+            [self.vectors[vector_2].direction_3d for _, (_, vector_2) in measures],
+            dtype=np.float32,
+        )
+        batched = batch_angles(directions_1, directions_2)
 
-        for name, measure in angle_map.items():
+        angles = {}
+        for k, (name, measure) in enumerate(measures):
             vector_1, vector_2 = measure
-            angles[name] = Angle(name, self.vectors[vector_1], self.vectors[vector_2])
+            angles[name] = Angle(
+                name,
+                self.vectors[vector_1],
+                self.vectors[vector_2],
+                angle_2d=float(batched[k, 0]),
+                angle_3d=float(batched[k, 1]),
+            )
 
         return angles
 
@@ -1,5 +1,22 @@
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from stream_pose_ml.blaze_pose import pose_kernels
 from stream_pose_ml.blaze_pose.blaze_pose_frame import BlazePoseFrame
-from stream_pose_ml.blaze_pose.enumerations import BlazePoseJoints
+from stream_pose_ml.blaze_pose.enumerations import blaze_pose_joints
+
+
+def _build_blaze_pose_frame(frame_data: dict, include_geometry: bool) -> BlazePoseFrame:
+    """Construct one BlazePoseFrame - module-level so it can be dispatched
+    to worker processes (bound methods don't pickle)."""
+    return BlazePoseFrame(
+        frame_data=frame_data,
+        generate_angles=include_geometry,
+        generate_distances=include_geometry,
+    )
 
 
 class BlazePoseSequence:
@@ -13,14 +30,14 @@ class BlazePoseSequence:
     frames: list[
         BlazePoseFrame
     ]  # a list of BlazePoseFrames representing the sequence data
-    joint_positions: list[str]  # required keys for a non-empty joint position object
+    joint_positions: tuple[str, ...]  # required keys for a non-empty joint position object
     include_geometry: bool  # compute angles / distance measure for each frame based on joint data
 
     def __init__(
         self, name: str, sequence: list = [], include_geometry: bool = False
     ) -> None:
         self.name = name
-        self.joint_positions = [joint.name for joint in BlazePoseJoints]
+        self.joint_positions = blaze_pose_joints
         for frame in sequence:
             if not self.validate_pose_schema(frame_data=frame):
                 raise BlazePoseSequenceError("Validation error!")
@@ -28,6 +45,7 @@ class BlazePoseSequence:
         self.sequence_data = sequence
         self.include_geometry = include_geometry
         self.frames = []
+        self.tensor = None
 
     def validate_pose_schema(self, frame_data: dict):
         """This method is responsible for ensuring data meets the required schema.
@@ -74,30 +92,114 @@ class BlazePoseSequence:
 
         return True
 
-    def generate_blaze_pose_frames_from_sequence(self) -> "BlazePoseSequence":
+    # below this many frames, process-pool startup and pickling outweigh
+    # any gain from parallel frame construction
+    PARALLEL_FRAME_THRESHOLD = 500
+
+    def generate_blaze_pose_frames_from_sequence(
+        self, parallel: bool = False
+    ) -> "BlazePoseSequence":
         """Create frame objects from this object's sequence of data.
 
         For each frame data in the sequence data list
-        generate a BlazePoseFrame object and add it to the list of frames
+        generate a BlazePoseFrame object and add it to the list of frames.
+        Frames are independent, so long sequences can optionally be
+        constructed across worker processes. Note that shipping the built
+        frame objects back to the parent costs a pickle round trip that can
+        exceed the construction work itself - measure on your workload, and
+        prefer build_tensor plus the pose_kernels module when raw throughput
+        matters.
+
+        Args:
+            parallel: bool
+                Default - False. Use a process pool for long sequences.
 
         Returns:
             self: BlazePoseSequence
                 returns this instance for chaining to init
         """
         try:
-            for frame_data in self.sequence_data:
-                bpf = BlazePoseFrame(
-                    frame_data=frame_data,
-                    generate_angles=self.include_geometry,
-                    generate_distances=self.include_geometry,
+            if parallel and len(self.sequence_data) >= self.PARALLEL_FRAME_THRESHOLD:
+                build_frame = functools.partial(
+                    _build_blaze_pose_frame,
+                    include_geometry=self.include_geometry,
                 )
-                self.frames.append(bpf)
+                # spawn, not fork - forking after the numba/mediapipe/cv2
+                # native thread pools have started can deadlock the child
+                # processes at shutdown
+                with ProcessPoolExecutor(
+                    mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    self.frames = list(
+                        executor.map(build_frame, self.sequence_data, chunksize=64)
+                    )
+            else:
+                for frame_data in self.sequence_data:
+                    bpf = BlazePoseFrame(
+                        frame_data=frame_data,
+                        generate_angles=self.include_geometry,
+                        generate_distances=self.include_geometry,
+                    )
+                    self.frames.append(bpf)
             return self
         except:
             raise BlazePoseSequenceError(
                 "There was a problem generating a BlazePoseFrame"
             )
 
+    def build_tensor(self) -> "np.ndarray":
+        """Stack the whole sequence into a single (F, num_joints, 6) array.
+
+        Rather than traversing per-frame objects, whole-sequence math
+        (midpoints, vectors, angles) can run as broadcast NumPy operations
+        over this tensor. Each row follows the BlazePoseFrame.JOINT_ARRAY_COLUMNS
+        layout and frames without joint position data are filled with NaN.
+        When the BlazePoseFrame objects have been generated their prebuilt
+        joint_array rows are stacked directly; otherwise the raw sequence
+        data dicts are parsed.
+
+        Returns:
+            tensor: np.ndarray
+                a (num_frames, num_joints, 6) float32 array of joint coordinates
+        """
+        num_frames = len(self.sequence_data)
+        num_joints = len(self.joint_positions)
+        columns = BlazePoseFrame.JOINT_ARRAY_COLUMNS
+        tensor = np.empty((num_frames, num_joints, 6), dtype=np.float32)
+        if len(self.frames) == num_frames:
+            for f, frame in enumerate(self.frames):
+                if frame.joint_array is None:
+                    tensor[f] = np.nan
+                else:
+                    tensor[f] = frame.joint_array
+        else:
+            for f, frame_data in enumerate(self.sequence_data):
+                joint_positions = frame_data["joint_positions"]
+                if not joint_positions:
+                    tensor[f] = np.nan
+                    continue
+                for j, joint in enumerate(self.joint_positions):
+                    joint_data = joint_positions[joint]
+                    for c, column in enumerate(columns):
+                        tensor[f, j, c] = joint_data[column]
+        self.tensor = tensor
+        return tensor
+
+    def compute_plumblines(self) -> "np.ndarray":
+        """Compute the plumbline direction vector for every frame at once.
+
+        Runs the JIT-compiled (or vectorized fallback) kernel over the
+        sequence tensor, building the tensor first if needed.
+
+        Returns:
+            plumblines: np.ndarray
+                a (num_frames, 6) array of mid-shoulder to mid-hip direction
+                vectors in the BlazePoseFrame.JOINT_ARRAY_COLUMNS layout
+        """
+        if self.tensor is None:
+            self.build_tensor()
+        return pose_kernels.compute_plumblines(self.tensor)
+
     def serialize_sequence_data(self):
         """This method returns a list of serialized frame data.
 
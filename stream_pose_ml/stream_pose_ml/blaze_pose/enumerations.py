@@ -37,3 +37,7 @@ blaze_pose_joints = (
     "right_foot_index",
 )
 BlazePoseJoints = Enum("BlazePoseJoints", blaze_pose_joints)
+
+# shared joint name -> index map - import this rather than rebuilding
+# per-instance name lists or index lookups
+JOINT_INDEX = {name: i for i, name in enumerate(blaze_pose_joints)}
@@ -1,12 +1,38 @@
+import asyncio
+import functools
 import os
+import sys
 import time
 import numpy as np
 from pathlib import Path
 import json
 import cv2
 import mediapipe as mp
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from stream_pose_ml.blaze_pose.enumerations import BlazePoseJoints
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from stream_pose_ml.blaze_pose.enumerations import blaze_pose_joints
+
+
+@functools.lru_cache(maxsize=4)
+def _get_pose(
+    min_detection_confidence: float = 0.5, min_tracking_confidence: float = 0.5
+):
+    """Return a shared mediapipe Pose instance for the given confidences.
+
+    Constructing a Pose rebuilds the model graph (hundreds of milliseconds)
+    and holds substantial RAM, so instances are cached here and reused across
+    videos and clients rather than recreated per process_video call.
+    """
+    return mp.solutions.pose.Pose(
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
+    )
 
 
 class MediaPipeClient:
@@ -21,7 +47,7 @@ class MediaPipeClient:
     video_input_path: str
     video_output_prefix: str
     id: int
-    joints: list  # an ordered list of joints corresponding to MediaPipe BlazePose model
+    joints: tuple  # ordered joint names corresponding to MediaPipe BlazePose model
     configuration: dict  # options to pass into mediapipe pose
     preprocess_video: bool  # whether to preprocess the video frame
 
@@ -53,7 +79,7 @@ class MediaPipeClient:
         self.configuration = configuration
         self.preprocess_video = preprocess_video
         self._results_raw = []
-        self.joints = [joint.name for joint in BlazePoseJoints]
+        self.joints = blaze_pose_joints
         self.frame_count = 0
         self.id = id
         # path to OP executable in repo
@@ -79,7 +105,10 @@ class MediaPipeClient:
         """This method runs mediapipe on a video referenced by this object.
 
         This method is responsible for iterating through frames in the input video
-        and running the keypoint pose extraction via media pipe.
+        and running the keypoint pose extraction via media pipe. Frame decode,
+        pose inference, and serialization run as three overlapped stages joined
+        by bounded queues, so the decoder can work ahead of inference instead
+        of the stages running strictly back to back.
 
 
         See https://github.com/google/mediapipe/issues/1589
@@ -96,78 +125,282 @@ class MediaPipeClient:
         # init frame counter
         self.frame_count = 0
 
-        # set up mediapipe
-        mp_pose = mp.solutions.pose
-        pose = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
-
-        # start video processing
-        cap = cv2.VideoCapture(f"{self.video_input_path}/{self.video_input_filename}")
+        # set up mediapipe - the Pose instance is cached and shared across
+        # videos, so clear any tracking state left from a previous video
+        pose = _get_pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+        if hasattr(pose, "reset"):
+            pose.reset()
+
+        # start video processing - try the FFMPEG backend first, asking at
+        # open time for hardware-accelerated decode (NVDEC, VAAPI, ...) where
+        # the build / GPU supports it; acceleration is an open-time option,
+        # setting it on an already-open capture is a no-op
+        video_path = f"{self.video_input_path}/{self.video_input_filename}"
+        if hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            cap = cv2.VideoCapture(
+                video_path,
+                cv2.CAP_FFMPEG,
+                [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+            )
+        else:
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+        if not cap.isOpened():
+            # builds without the FFMPEG backend (e.g. GStreamer-only) fall
+            # back to OpenCV's backend auto-selection
+            cap = cv2.VideoCapture(video_path)
         if cap.isOpened() == False:
             raise MediaPipeClientError(
                 f"Error opening file: {self.video_input_path}/{self.video_input_filename}"
             )
-        while cap.isOpened():
-            # TODO refactor this into stages
-            # bail if we go over processing limit
-            if limit is not None and self.frame_count >= limit:
-                return
-            ret, image = cap.read()
+        asyncio.run(self._run_frame_pipeline(cap, pose, limit))
+        return self
+
+    async def _run_frame_pipeline(self, cap, pose, limit: int = None) -> None:
+        """Drive the decode -> infer -> serialize stages concurrently.
+
+        cv2.VideoCapture.read and Pose.process both release the GIL inside
+        native code, so running them in executor threads lets decode and
+        inference overlap. The bounded queues keep a few frames in flight
+        for backpressure without unbounded buffering, and the single
+        consumer per queue preserves frame order.
+        """
+        raw_frame_queue = asyncio.Queue(maxsize=4)
+        result_queue = asyncio.Queue(maxsize=4)
+        await asyncio.gather(
+            self._read_frames(cap, raw_frame_queue, limit),
+            self._infer_frames(raw_frame_queue, result_queue, pose),
+            self._serialize_frames(result_queue),
+        )
+
+    async def _read_frames(self, cap, raw_frame_queue, limit: int = None) -> None:
+        """Decode stage - read frames off the capture until EOF or limit."""
+        loop = asyncio.get_running_loop()
+        # resolve the optional limit once so the hot loop has a single
+        # comparison per frame instead of a None test plus a comparison
+        max_frames = limit if limit is not None else sys.maxsize
+        while cap.isOpened() and self.frame_count < max_frames:
+            ret, image = await loop.run_in_executor(None, cap.read)
             if not ret:
                 break
             if self.preprocess_video:
                 image = self.run_preprocess_video(image=image)
-            # build data object for this frame
             self.frame_count += 1
             self.image_dimensions = image.shape
-            h, w, _ = self.image_dimensions
+            await raw_frame_queue.put((self.frame_count, image))
+        # sentinel - tell the inference stage we're done
+        await raw_frame_queue.put(None)
+
+    async def _infer_frames(self, raw_frame_queue, result_queue, pose) -> None:
+        """Inference stage - run mediapipe pose extraction on decoded frames."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await raw_frame_queue.get()
+            if item is None:
+                break
+            frame_number, image = item
+            # mediapipe does its thing
+            results = await loop.run_in_executor(
+                None, self.process_frame, image, pose
+            )
+            await result_queue.put((frame_number, image.shape, results))
+        # sentinel - tell the serialization stage we're done
+        await result_queue.put(None)
+
+    async def _serialize_frames(self, result_queue) -> None:
+        """Serialization stage - format pose results into frame data dicts."""
+        while True:
+            item = await result_queue.get()
+            if item is None:
+                break
+            frame_number, image_shape, results = item
+            h, w, _ = image_shape
+            # build data object for this frame
             frame_data = {
                 "sequence_id": self.id,
                 "sequence_source": "mediapipe",
-                "frame_number": self.frame_count,
+                "frame_number": frame_number,
                 "image_dimensions": {"height": h, "width": w},
                 "joint_positions": {},
             }
-            # mediapipe does its thing
-            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            results = self.process_frame(image, pose)
             # store the pose object for introspection
             self._results_raw.append(results)
             if not results.pose_landmarks:
                 self.frame_data_list.append(frame_data)
                 continue
 
-            # format pose object how we like
+            # format pose object how we like - the landmark container is
+            # indexable as-is, no need to materialize it into a list first
             pose_landmarks = self.serialize_pose_landmarks(
-                pose_landmarks=list(results.pose_landmarks.landmark)
+                pose_landmarks=results.pose_landmarks.landmark
             )
             frame_data["joint_positions"] = pose_landmarks
             # add frame to client pose list
             self.frame_data_list.append(frame_data)
-        return self
 
     @staticmethod
     def process_frame(image, pose):
-        # set up mediapipe
-        return pose.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        # BGR -> RGB as a zero-copy reversed view - mediapipe accepts
+        # non-contiguous arrays, so no cv2.cvtColor allocation is needed
+        return pose.process(image[:, :, ::-1])
 
     def write_pose_data_to_file(self):
         """Write this object's video pose data to file.
 
         This method iterates through each pose data dictionary in the pose_data list.
-        It then creates a json file at the json output path with all this data
+        It then creates a json file at the json output path with all this data.
+        Encoding uses orjson when installed - its C encoder is several times
+        faster than the stdlib on these per-frame dicts - falling back to the
+        stdlib json module otherwise.
         """
         try:
             os.makedirs(self.json_output_path)
             for frame_data in self.frame_data_list:
                 file_path = f"{self.json_output_path}/keypoints-{frame_data['frame_number']:04d}.json"
-                with open(file_path, "w") as f:
-                    json.dump(frame_data, f)
+                if orjson is not None:
+                    with open(file_path, "wb") as f:
+                        f.write(
+                            orjson.dumps(frame_data, option=orjson.OPT_SERIALIZE_NUMPY)
+                        )
+                else:
+                    with open(file_path, "w") as f:
+                        json.dump(frame_data, f)
                     # print(
                     #     f"Successfully wrote keypoints from {self.video_input_filename} to {file_path}"
                     # )
         except:
             raise MediaPipeClientError("There was a problem writing pose data to json")
 
+    def write_pose_data_to_parquet(self) -> str:
+        """Write this object's video pose data to a single parquet file.
+
+        Instead of one json file per frame - thousands of tiny files and
+        syscalls per video - all frames are stored in one columnar file:
+        scalar metadata columns plus a fixed-size list column holding each
+        frame's (num_joints * 6) coordinate values, ordered joint by joint as
+        [x, y, z, x_normalized, y_normalized, z_normalized]. Frames where no
+        pose was detected hold NaN coordinates. The joint order is recorded
+        in the file's schema metadata.
+
+        Returns:
+            file_path: str
+                the path of the parquet file that was written
+        """
+        try:
+            num_values = len(self.joints) * 6
+            coordinates = np.full(
+                (len(self.frame_data_list), num_values), np.nan, dtype=np.float32
+            )
+            for f, frame_data in enumerate(self.frame_data_list):
+                joint_positions = frame_data["joint_positions"]
+                if not joint_positions:
+                    continue
+                values = []
+                for joint in self.joints:
+                    position = joint_positions[joint]
+                    values.extend(
+                        (
+                            position["x"],
+                            position["y"],
+                            position["z"],
+                            position["x_normalized"],
+                            position["y_normalized"],
+                            position["z_normalized"],
+                        )
+                    )
+                coordinates[f] = values
+            table = pa.Table.from_pydict(
+                {
+                    "sequence_id": [
+                        frame_data["sequence_id"]
+                        for frame_data in self.frame_data_list
+                    ],
+                    "sequence_source": [
+                        frame_data["sequence_source"]
+                        for frame_data in self.frame_data_list
+                    ],
+                    "frame_number": [
+                        frame_data["frame_number"]
+                        for frame_data in self.frame_data_list
+                    ],
+                    "image_height": [
+                        frame_data["image_dimensions"]["height"]
+                        for frame_data in self.frame_data_list
+                    ],
+                    "image_width": [
+                        frame_data["image_dimensions"]["width"]
+                        for frame_data in self.frame_data_list
+                    ],
+                    "joint_coordinates": pa.FixedSizeListArray.from_arrays(
+                        pa.array(coordinates.ravel(), type=pa.float32()), num_values
+                    ),
+                }
+            )
+            table = table.replace_schema_metadata({"joints": json.dumps(self.joints)})
+            os.makedirs(self.json_output_path, exist_ok=True)
+            file_path = f"{self.json_output_path}/keypoints.parquet"
+            pq.write_table(table, file_path, compression="zstd")
+            return file_path
+        except:
+            raise MediaPipeClientError(
+                "There was a problem writing pose data to parquet"
+            )
+
+    @staticmethod
+    def read_pose_data_from_parquet(file_path: str) -> list:
+        """Read pose data written by write_pose_data_to_parquet.
+
+        Reconstructs the same list of frame data dictionaries that was
+        written, using the joint order recorded in the file's schema
+        metadata. Frames whose coordinates are all NaN - no pose detected -
+        come back with an empty joint_positions dict, mirroring the
+        in-memory frame_data_list.
+
+        Args:
+            file_path: str
+                path to a keypoints.parquet file
+
+        Returns:
+            frame_data_list: list[dict]
+                the reconstructed frame data dictionaries
+        """
+        try:
+            table = pq.read_table(file_path)
+            joints = json.loads(table.schema.metadata[b"joints"])
+            columns = table.to_pydict()
+            coordinates = np.asarray(
+                table.column("joint_coordinates").combine_chunks().flatten()
+            ).reshape(table.num_rows, len(joints), 6)
+            frame_data_list = []
+            for f in range(table.num_rows):
+                frame_data = {
+                    "sequence_id": columns["sequence_id"][f],
+                    "sequence_source": columns["sequence_source"][f],
+                    "frame_number": columns["frame_number"][f],
+                    "image_dimensions": {
+                        "height": columns["image_height"][f],
+                        "width": columns["image_width"][f],
+                    },
+                    "joint_positions": {},
+                }
+                if not np.isnan(coordinates[f]).all():
+                    frame_data["joint_positions"] = {
+                        joint: {
+                            "x": float(coordinates[f, j, 0]),
+                            "y": float(coordinates[f, j, 1]),
+                            "z": float(coordinates[f, j, 2]),
+                            "x_normalized": float(coordinates[f, j, 3]),
+                            "y_normalized": float(coordinates[f, j, 4]),
+                            "z_normalized": float(coordinates[f, j, 5]),
+                        }
+                        for j, joint in enumerate(joints)
+                    }
+                frame_data_list.append(frame_data)
+            return frame_data_list
+        except:
+            raise MediaPipeClientError(
+                "There was a problem reading pose data from parquet"
+            )
+
     @staticmethod
     def run_preprocess_video(image: np.ndarray) -> np.ndarray:
         """Run some basic image preprocessing steps.
@@ -250,8 +483,10 @@ class MediaPipeClient:
     def serialize_pose_landmarks(self, pose_landmarks: list):
         """Get a formatted list of video data coordinates.
 
-        This method take a list of pose landmarks (casted from the mediapipe pose_landmarks.landmark object)
-        and extracts x, y, z data, performs a normalization of reference joints, then stores all the data in a dictionary
+        This method takes pose landmarks (the mediapipe pose_landmarks.landmark
+        container, or any indexable sequence of landmarks) and extracts x, y, z
+        data, performs a normalization of reference joints, then stores all the
+        data in a dictionary
 
         Note: according to MediaPipe docs "z" uses roughly same scale as x. May not be very accurate.
 
@@ -261,7 +496,7 @@ class MediaPipeClient:
                     mp_pose = mp.solutions.pose
                     pose = mp_pose.Pose()
                     pose.process()
-                    pose_landmarks = list(results.pose_landmarks.landmark)
+                    pose_landmarks = results.pose_landmarks.landmark
 
 
         Rerturns
@@ -286,41 +521,33 @@ class MediaPipeClient:
             reference_point_midpoint = self.calculate_reference_point_midpoint(
                 joint_1_coordinates, joint_2_coordinates
             )
+            # pull all coordinates into a (num_joints, 3) array so normalization
+            # is a single vectorized operation rather than a per-joint Python loop
+            try:
+                coordinates = np.array(
+                    [[lm.x, lm.y, lm.z] for lm in pose_landmarks], dtype=np.float32
+                )
+            except:
+                coordinates = np.array(
+                    [[lm["x"], lm["y"], lm["z"]] for lm in pose_landmarks],
+                    dtype=np.float32,
+                )
+            midpoint = np.array(
+                [reference_point_midpoint["x"], reference_point_midpoint["y"]],
+                dtype=np.float32,
+            )
+            # Not normalizing z here, as the coordinate is not accurate
+            # according to docs, z uses "roughly the same scale as x"
+            normalized_xy = (coordinates[:, :2] / reference_point_distance) - midpoint
             for i, joint in enumerate(self.joints):
-                try:
-                    x_normed = (
-                        pose_landmarks[i].x / reference_point_distance
-                    ) - reference_point_midpoint["x"]
-                    y_normed = (
-                        pose_landmarks[i].y / reference_point_distance
-                    ) - reference_point_midpoint["y"]
-                    # Not normalizing z here, as the coordinate is not accurate
-                    # according to docs, z uses "roughly the same scale as x"
-                    landmarks[joint] = {
-                        "x": pose_landmarks[i].x,
-                        "y": pose_landmarks[i].y,
-                        "z": pose_landmarks[i].z,
-                        "x_normalized": x_normed,
-                        "y_normalized": y_normed,
-                        "z_normalized": pose_landmarks[i].z,
-                    }
-                except:
-                    x_normed = (
-                        pose_landmarks[i]["x"] / reference_point_distance
-                    ) - reference_point_midpoint["x"]
-                    y_normed = (
-                        pose_landmarks[i]["y"] / reference_point_distance
-                    ) - reference_point_midpoint["y"]
-                    # Not normalizing z here, as the coordinate is not accurate
-                    # according to docs, z uses "roughly the same scale as x"
-                    landmarks[joint] = {
-                        "x": pose_landmarks[i]["x"],
-                        "y": pose_landmarks[i]["y"],
-                        "z": pose_landmarks[i]["z"],
-                        "x_normalized": x_normed,
-                        "y_normalized": y_normed,
-                        "z_normalized": pose_landmarks[i]["z"],
-                    }
+                landmarks[joint] = {
+                    "x": float(coordinates[i, 0]),
+                    "y": float(coordinates[i, 1]),
+                    "z": float(coordinates[i, 2]),
+                    "x_normalized": float(normalized_xy[i, 0]),
+                    "y_normalized": float(normalized_xy[i, 1]),
+                    "z_normalized": float(coordinates[i, 2]),
+                }
         return landmarks
 
 
@@ -0,0 +1,134 @@
+"""Hot numerical kernels for whole-sequence pose math.
+
+These operate on the (num_frames, num_joints, 6) tensor produced by
+BlazePoseSequence.build_tensor. When Numba is installed the kernels are
+JIT-compiled (cached to disk, fastmath, parallel over frames). Without
+Numba the compiled Cython extension (_pose_kernels, built by setup.py when
+Cython is available) is used if it imports, and otherwise equivalent
+vectorized NumPy implementations - both Numba and the extension remain
+optional.
+
+compute_plumblines(tensor) returns a (num_frames, 6) array of mid-shoulder
+to mid-hip direction vectors in the BlazePoseFrame.JOINT_ARRAY_COLUMNS layout.
+
+compute_vector_angles(tensor, pair_index) takes a (num_angles, 4) int array
+of joint row indices [a1, a2, b1, b2] defining vector a1->a2 and vector
+b1->b2 for each angle, and returns a (num_frames, num_angles, 2) array of
+2D and 3D angles in radians.
+"""
+import math
+
+import numpy as np
+
+from stream_pose_ml.blaze_pose.enumerations import JOINT_INDEX
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    CYTHON_AVAILABLE = False
+else:
+    try:
+        from stream_pose_ml.blaze_pose import _pose_kernels
+
+        CYTHON_AVAILABLE = True
+    except ImportError:
+        CYTHON_AVAILABLE = False
+
+# joint row indices used by the plumbline kernel
+LEFT_SHOULDER = JOINT_INDEX["left_shoulder"]
+RIGHT_SHOULDER = JOINT_INDEX["right_shoulder"]
+LEFT_HIP = JOINT_INDEX["left_hip"]
+RIGHT_HIP = JOINT_INDEX["right_hip"]
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def compute_plumblines(tensor):
+        num_frames = tensor.shape[0]
+        out = np.empty((num_frames, tensor.shape[2]), dtype=np.float32)
+        for f in prange(num_frames):
+            for c in range(tensor.shape[2]):
+                neck = 0.5 * (
+                    tensor[f, LEFT_SHOULDER, c] + tensor[f, RIGHT_SHOULDER, c]
+                )
+                mid_hip = 0.5 * (tensor[f, LEFT_HIP, c] + tensor[f, RIGHT_HIP, c])
+                out[f, c] = mid_hip - neck
+        return out
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def compute_vector_angles(tensor, pair_index):
+        num_frames = tensor.shape[0]
+        num_angles = pair_index.shape[0]
+        out = np.empty((num_frames, num_angles, 2), dtype=np.float32)
+        for f in prange(num_frames):
+            for k in range(num_angles):
+                a1, a2, b1, b2 = (
+                    pair_index[k, 0],
+                    pair_index[k, 1],
+                    pair_index[k, 2],
+                    pair_index[k, 3],
+                )
+                v1x = tensor[f, a2, 0] - tensor[f, a1, 0]
+                v1y = tensor[f, a2, 1] - tensor[f, a1, 1]
+                v1z = tensor[f, a2, 2] - tensor[f, a1, 2]
+                v2x = tensor[f, b2, 0] - tensor[f, b1, 0]
+                v2y = tensor[f, b2, 1] - tensor[f, b1, 1]
+                v2z = tensor[f, b2, 2] - tensor[f, b1, 2]
+                # 2D angle from the x/y components only
+                n1 = math.sqrt(v1x * v1x + v1y * v1y) + 1e-12
+                n2 = math.sqrt(v2x * v2x + v2y * v2y) + 1e-12
+                cos = (v1x * v2x + v1y * v2y) / (n1 * n2)
+                out[f, k, 0] = math.acos(min(1.0, max(-1.0, cos)))
+                # 3D angle
+                n1 = math.sqrt(v1x * v1x + v1y * v1y + v1z * v1z) + 1e-12
+                n2 = math.sqrt(v2x * v2x + v2y * v2y + v2z * v2z) + 1e-12
+                cos = (v1x * v2x + v1y * v2y + v1z * v2z) / (n1 * n2)
+                out[f, k, 1] = math.acos(min(1.0, max(-1.0, cos)))
+        return out
+
+elif CYTHON_AVAILABLE:
+
+    def compute_plumblines(tensor):
+        tensor = np.ascontiguousarray(tensor, dtype=np.float32)
+        return _pose_kernels.compute_plumblines(
+            tensor, LEFT_SHOULDER, RIGHT_SHOULDER, LEFT_HIP, RIGHT_HIP
+        )
+
+    def compute_vector_angles(tensor, pair_index):
+        tensor = np.ascontiguousarray(tensor, dtype=np.float32)
+        pair_index = np.ascontiguousarray(pair_index, dtype=np.int64)
+        return _pose_kernels.compute_vector_angles(tensor, pair_index)
+
+
+# the vectorized NumPy implementations are always defined - they are the
+# fallback when no compiled path imports, and the reference the compiled
+# paths are tested against
+def compute_plumblines_numpy(tensor):
+    neck = 0.5 * (tensor[:, LEFT_SHOULDER] + tensor[:, RIGHT_SHOULDER])
+    mid_hip = 0.5 * (tensor[:, LEFT_HIP] + tensor[:, RIGHT_HIP])
+    return (mid_hip - neck).astype(np.float32)
+
+
+def compute_vector_angles_numpy(tensor, pair_index):
+    v1 = tensor[:, pair_index[:, 1], :3] - tensor[:, pair_index[:, 0], :3]
+    v2 = tensor[:, pair_index[:, 3], :3] - tensor[:, pair_index[:, 2], :3]
+    out = np.empty((tensor.shape[0], pair_index.shape[0], 2), dtype=np.float32)
+    for column, dims in enumerate((slice(0, 2), slice(0, 3))):
+        u1 = v1[..., dims]
+        u2 = v2[..., dims]
+        n1 = np.linalg.norm(u1, axis=-1) + 1e-12
+        n2 = np.linalg.norm(u2, axis=-1) + 1e-12
+        cos = np.einsum("fki,fki->fk", u1, u2) / (n1 * n2)
+        out[..., column] = np.arccos(np.clip(cos, -1.0, 1.0))
+    return out
+
+
+if not NUMBA_AVAILABLE and not CYTHON_AVAILABLE:
+    compute_plumblines = compute_plumblines_numpy
+    compute_vector_angles = compute_vector_angles_numpy
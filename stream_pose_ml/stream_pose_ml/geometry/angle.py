@@ -1,8 +1,44 @@
+import math
+
 import numpy as np
 
 from stream_pose_ml.geometry.vector import Vector
 
 
+def batch_angles(vectors_1: "np.ndarray", vectors_2: "np.ndarray") -> "np.ndarray":
+    """Compute 2D and 3D angles between two stacks of directional vectors at once.
+
+    This runs the unit-vector / dot-product / arccos pipeline as whole-array
+    operations so K angles cost a handful of NumPy calls rather than K Python
+    dispatches of tiny-vector math.
+
+    Args:
+        vectors_1: np.ndarray
+            a (K, 3) array of directional vectors
+        vectors_2: np.ndarray
+            a (K, 3) array of directional vectors
+
+    Returns:
+        angles: np.ndarray
+            a (K, 2) array where column 0 is the 2D angle (x/y components only)
+            and column 1 is the 3D angle, both in radians
+    """
+    # float32 is plenty for low-precision landmark estimates and halves the
+    # memory bandwidth of the batched math
+    vectors_1 = np.atleast_2d(np.asarray(vectors_1, dtype=np.float32))
+    vectors_2 = np.atleast_2d(np.asarray(vectors_2, dtype=np.float32))
+    angles = np.empty((vectors_1.shape[0], 2), dtype=np.float32)
+    for column, dims in enumerate((slice(0, 2), slice(0, 3))):
+        v1 = vectors_1[:, dims]
+        v2 = vectors_2[:, dims]
+        # epsilon guards degenerate zero-length vectors without a branch
+        u1 = v1 / (np.linalg.norm(v1, axis=-1, keepdims=True) + 1e-12)
+        u2 = v2 / (np.linalg.norm(v2, axis=-1, keepdims=True) + 1e-12)
+        cos = np.einsum("ij,ij->i", u1, u2)
+        angles[:, column] = np.arccos(np.clip(cos, -1.0, 1.0))
+    return angles
+
+
 class Angle:
     """This is a data structure representing angles between 2d and 3d vectors.
 
@@ -11,6 +47,20 @@ class Angle:
 
     """
 
+    # fixed attribute storage - one Angle per named measure per frame, so
+    # skipping the per-instance __dict__ meaningfully cuts memory
+    __slots__ = (
+        "name",
+        "vector_1",
+        "vector_2",
+        "angle_2d",
+        "angle_3d",
+        "angle_2d_radians",
+        "angle_3d_radians",
+        "angle_2d_degrees",
+        "angle_3d_degrees",
+    )
+
     name: str
     vector_1: Vector
     vector_2: Vector
@@ -21,23 +71,36 @@ class Angle:
     angle_2d_degrees: float
     angle_3d_degrees: float
 
-    def __init__(self, name: str, vector1: Vector, vector2: Vector) -> None:
+    def __init__(
+        self,
+        name: str,
+        vector1: Vector,
+        vector2: Vector,
+        angle_2d: float = None,
+        angle_3d: float = None,
+    ) -> None:
         """Initialize an Angle object.
 
         Upon initialization this class creates a named angle object
         where the angle between two vectors is calculated in radians
-        and degrees with accessible attributes for introspection
+        and degrees with accessible attributes for introspection.
+
+        When angle_2d / angle_3d are passed in - e.g. precomputed by one
+        batch_angles call over a whole frame's angle map - they are stored
+        directly rather than recomputed here.
         """
         try:
             self.name = name
             self.vector_1 = vector1
             self.vector_2 = vector2
-            self.angle_2d = self.angle_between(
-                vector1.direction_2d, vector2.direction_2d
-            )
-            self.angle_3d = self.angle_between(
-                vector1.direction_3d, vector2.direction_3d
-            )
+            if angle_2d is None or angle_3d is None:
+                angles = batch_angles(
+                    np.asarray(vector1.direction_3d), np.asarray(vector2.direction_3d)
+                )
+                angle_2d = float(angles[0, 0])
+                angle_3d = float(angles[0, 1])
+            self.angle_2d = angle_2d
+            self.angle_3d = angle_3d
             self.angle_2d_radians = self.angle_2d  # alias
             self.angle_3d_radians = self.angle_3d  # alias
             self.angle_2d_degrees = np.degrees(self.angle_2d)
@@ -62,7 +125,13 @@ class Angle:
                 regardless of normalized values
         """
         try:
-            return vector / np.linalg.norm(vector)
+            # sqrt(v . v) directly - np.linalg.norm adds axis/dtype dispatch
+            # overhead that dominates for a single tiny vector; the epsilon
+            # guards zero-length vectors (coincident joints) without
+            # perturbing the exact results for nonzero input
+            vector = np.asarray(vector, dtype=np.float64)
+            norm = math.sqrt(float(vector @ vector))
+            return vector * (1.0 / (norm if norm else 1e-12))
         except:
             raise AngleError("There was an error computing the unit vector")
 
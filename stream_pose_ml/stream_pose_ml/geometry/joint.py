@@ -3,6 +3,32 @@ class Joint:
     Coordinates of a joint represented in 2D and 3D, normalized and not normalized
     """
 
+    # keys that must be present in the joint_data dict
+    REQUIRED_KEYS = frozenset(
+        {
+            "x",
+            "y",
+            "z",
+            "x_normalized",
+            "y_normalized",
+            "z_normalized",
+            "image_dimensions",
+        }
+    )
+
+    # fixed attribute storage - joints are created 33 times per frame, so
+    # skipping the per-instance __dict__ meaningfully cuts memory
+    __slots__ = (
+        "name",
+        "x",
+        "y",
+        "z",
+        "x_normalized",
+        "y_normalized",
+        "z_normalized",
+        "image_dimensions",
+    )
+
     # the name of this joint
     name: str
     # x, y, z as 0-1
@@ -37,16 +63,7 @@ class Joint:
             exception: JointError
         """
         try:
-            required_keys = [
-                "x",
-                "y",
-                "z",
-                "x_normalized",
-                "y_normalized",
-                "z_normalized",
-                "image_dimensions",
-            ]
-            if not all([key in required_keys for key in joint_data]):
+            if not self.REQUIRED_KEYS.issubset(joint_data):
                 raise JointError(
                     "The required data is missing from the joint data dictionary."
                 )
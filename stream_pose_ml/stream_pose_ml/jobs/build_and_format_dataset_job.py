@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import time
 
 from stream_pose_ml.services.video_data_merge_service import (
@@ -167,6 +169,36 @@ class BuildAndFormatDatasetJob:
         df.to_csv(output_path)
         return True
 
+    @staticmethod
+    def write_dataset_to_parquet(
+        parquet_location: str, formatted_dataset: list, filename: str = None
+    ):
+        """Write the passed serialized dataset to a parquet file.
+
+        Arrow infers the schema and writes columnar binary directly from the
+        list of row dicts, skipping both the pandas json_normalize
+        intermediate and the float-to-decimal-string encoding that make the
+        csv path slow and large on big datasets. Prefer this for datasets of
+        any size; write_dataset_to_csv remains for debugging.
+
+        Args:
+            parquet_location: str
+                path to where file should be saved
+            formatted_dataset: list[dict]
+                list of serialized data dicts
+            filename: str
+                if a custom filename is desired, pass in here. otherwise this will be a timestamp
+        Returns:
+            success: bool
+                True if successful
+        """
+        table = pa.Table.from_pylist(formatted_dataset)
+        if filename is None:
+            filename = f"dataset_{time.time_ns()}"
+        output_path = f"{parquet_location}/{filename}.parquet"
+        pq.write_table(table, output_path, compression="zstd")
+        return True
+
 
 class BuildAndFormatDatasetJobError(Exception):
     """Raise when there's an issue with the BuildAndFormatDatasetJob class"""
@@ -186,3 +186,62 @@ class TestBlazePoseFrame(unittest.TestCase):
         self.assertRaises(
             BlazePoseFrameError, lambda: bpf.validate_joint_position_data({})
         )
+
+
+class TestBlazePoseFrameVectors(unittest.TestCase):
+    """Vector construction checks on a synthetic frame - no source video needed."""
+
+    @classmethod
+    def setUpClass(self) -> None:
+        joint_positions = {
+            joint: {
+                "x": float(i),
+                "y": float(i) * 2,
+                "z": float(i) * 3,
+                "x_normalized": float(i) * 4,
+                "y_normalized": float(i) * 5,
+                "z_normalized": float(i) * 6,
+            }
+            for i, joint in enumerate(BlazePoseFrame.joint_position_names)
+        }
+        self.frame_data = {
+            "sequence_id": 1,
+            "sequence_source": "mediapipe",
+            "frame_number": 1,
+            "image_dimensions": {"height": 100, "width": 100},
+            "joint_positions": joint_positions,
+        }
+
+    def test_get_vector_uses_both_joints(self):
+        """
+        GIVEN a BlazePoseFrame with distinct joint positions
+        WHEN a vector is created between two different joints
+        THEN the vector endpoints come from each joint and its direction is non-zero
+        """
+        bpf = BlazePoseFrame(frame_data=self.frame_data)
+        vector = bpf.get_vector("nose_left_eye", "nose", "left_eye")
+        self.assertEqual(vector.x1, bpf.joints["nose"].x)
+        self.assertEqual(vector.x2, bpf.joints["left_eye"].x)
+        self.assertNotEqual(vector.direction_2d, (0.0, 0.0))
+        self.assertNotEqual(vector.direction_3d, (0.0, 0.0, 0.0))
+
+    def test_joint_array_matches_joints(self):
+        """
+        GIVEN a BlazePoseFrame with joint positions
+        WHEN the SoA joint array is populated
+        THEN each row matches the corresponding Joint object's coordinates
+        """
+        bpf = BlazePoseFrame(frame_data=self.frame_data)
+        for name, index in BlazePoseFrame.JOINT_INDEX.items():
+            joint = bpf.joints[name]
+            self.assertEqual(
+                list(bpf.joint_array[index]),
+                [
+                    joint.x,
+                    joint.y,
+                    joint.z,
+                    joint.x_normalized,
+                    joint.y_normalized,
+                    joint.z_normalized,
+                ],
+            )
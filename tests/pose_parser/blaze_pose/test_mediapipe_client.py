@@ -1,10 +1,14 @@
 import unittest
 import shutil
+import tempfile
 import time
 from pathlib import Path
 import os
 import json
 
+import pyarrow.parquet as pq
+
+from stream_pose_ml.blaze_pose.enumerations import blaze_pose_joints
 from stream_pose_ml.blaze_pose.mediapipe_client import (
     MediaPipeClient,
     MediaPipeClientError,
@@ -123,3 +127,75 @@ class TestMediaPipeClient(unittest.TestCase):
                 self.assertIn("frame_number", pose_data)
                 self.assertIn("joint_positions", pose_data)
                 self.assertIn("image_dimensions", pose_data)
+
+
+class TestMediaPipeParquetRoundTrip(unittest.TestCase):
+    """Pin the keypoints.parquet schema with a write/read round trip.
+
+    Uses synthetic frame data rather than a processed video so the schema -
+    fixed-size list coordinate layout plus joints metadata - stays covered
+    without the test video fixtures.
+    """
+
+    def setUp(self) -> None:
+        self.output_path = tempfile.mkdtemp()
+        self.client = MediaPipeClient.__new__(MediaPipeClient)
+        self.client.joints = blaze_pose_joints
+        self.client.json_output_path = f"{self.output_path}/test-keypoints"
+        # joint values chosen exactly representable in float32 so the
+        # round trip compares equal
+        self.frame_data_list = []
+        for frame_number in range(3):
+            joint_positions = {}
+            if frame_number != 1:  # frame 1 simulates no pose detected
+                joint_positions = {
+                    joint: {
+                        "x": float(j),
+                        "y": float(j) + 0.5,
+                        "z": float(j) - 0.25,
+                        "x_normalized": float(j) * 2.0,
+                        "y_normalized": float(j) * 4.0,
+                        "z_normalized": float(j) * 0.5,
+                    }
+                    for j, joint in enumerate(blaze_pose_joints)
+                }
+            self.frame_data_list.append(
+                {
+                    "sequence_id": 12345,
+                    "sequence_source": "mediapipe",
+                    "frame_number": frame_number,
+                    "image_dimensions": {"height": 1080, "width": 1920},
+                    "joint_positions": joint_positions,
+                }
+            )
+        self.client.frame_data_list = self.frame_data_list
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.output_path, ignore_errors=True)
+        return super().tearDown()
+
+    def test_write_and_read_round_trip(self):
+        """
+        GIVEN a MediaPipeClient with frame data
+        WHEN the data is written to parquet and read back
+        THEN the reconstructed frame data matches what was written
+        """
+        file_path = self.client.write_pose_data_to_parquet()
+        self.assertTrue(os.path.exists(file_path))
+        restored = MediaPipeClient.read_pose_data_from_parquet(file_path)
+        self.assertEqual(restored, self.frame_data_list)
+
+    def test_parquet_schema(self):
+        """
+        GIVEN a written keypoints parquet file
+        WHEN its schema is inspected
+        THEN the coordinate layout and joints metadata match the writer's contract
+        """
+        file_path = self.client.write_pose_data_to_parquet()
+        table = pq.read_table(file_path)
+        coordinates_type = table.schema.field("joint_coordinates").type
+        self.assertEqual(coordinates_type.list_size, len(blaze_pose_joints) * 6)
+        self.assertEqual(
+            json.loads(table.schema.metadata[b"joints"]), list(blaze_pose_joints)
+        )